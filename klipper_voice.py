@@ -19,8 +19,45 @@ import logging
 import json
 import time
 import os
+import queue
+import re
+import shutil
 import subprocess
+import sys
 import threading
+import types
+from collections import deque
+
+# Module logger, fetched once at import time
+_LOG = logging.getLogger(__name__)
+
+# G-code parameter name and default for VOICE_TEST
+_TYPE_KEY = sys.intern('TYPE')
+_DEFAULT_TEST_TYPE = sys.intern('ready')
+
+# Resolved executable paths by command name. Only hits are kept, so a
+# player installed later is still found after a Klipper RESTART, which
+# reuses this module.
+_BINARY_CACHE = {}
+
+
+def _find_binary(name):
+    """
+    Look up an executable on PATH, memoizing successful lookups.
+    
+    Args:
+        name (str): Command name, e.g. 'mpg123'
+        
+    Returns:
+        str or None: Full path to the executable, or None if not found
+    """
+    path = _BINARY_CACHE.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _BINARY_CACHE[name] = path
+    return path
+
 
 class KlipperVoice:
     """
@@ -31,8 +68,101 @@ class KlipperVoice:
     - Event handling
     - G-code command registration
     - Web API endpoints
-    - Audio output simulation (for testing)
+    - Audio playback through an auto-detected external player
     """
+    # Every instance attribute must be listed here; there is no __dict__
+    __slots__ = (
+        # Klipper objects and configuration
+        'printer', 'reactor', 'name', 'enabled', 'volume', 'language',
+        'voice_speed', 'audio_base_path', 'use_hardware_volume',
+        'min_announcement_interval', 'supported_formats',
+        '_supported_formats_csv', 'voice_messages', 'auto_announce',
+        # Audio player selection
+        'audio_players', 'selected_player', '_argv_prefix', '_argv_suffix',
+        '_volume_args', '_player_proc', '_player_done', '_player_started',
+        # Announcement state
+        'last_announcement', 'last_announcement_time', '_next_allowed_time',
+        '_last_same_type_time', 'announcement_queue',
+        # Playback state
+        'current_playback_process', '_playback_done', '_play_queue',
+        '_init_done', '_worker', '_worker_stopped',
+        # Audio file scan results
+        '_fname_re', 'audio_file_cache', '_audio_flat', '_audio_fallback',
+        '_total_audio_files', '_message_types_str', '_audio_dir_mtime',
+        '_cache_path', '_last_forced_scan',
+        # Precomputed status and lookups
+        '_available_types_str', '_valid_test_types', '_static_status',
+        '_status_cache', '_status_dirty', '_status_dict', '_webhook_status',
+        # Logging and pre-bound methods
+        'logger',
+    )
+    
+    # G-code commands as (command name, handler method name); the help text
+    # is read from the matching <handler>_help attribute
+    _GCODE_CMDS = (
+        ('VOICE_ANNOUNCE', 'cmd_VOICE_ANNOUNCE'),
+        ('VOICE_CONFIG', 'cmd_VOICE_CONFIG'),
+        ('VOICE_STATUS', 'cmd_VOICE_STATUS'),
+        ('VOICE_TEST', 'cmd_VOICE_TEST'),
+        ('VOICE_SCAN', 'cmd_VOICE_SCAN'),
+    )
+    
+    # VOICE_CONFIG parameters reported back after a change, as
+    # (parameter, report template, attribute holding the new value)
+    _CONFIG_FIELDS = (
+        ('ENABLE', "enabled=%s", 'enabled'),
+        ('VOLUME', "volume=%.1f", 'volume'),
+        ('SPEED', "speed=%.1f", 'voice_speed'),
+        ('LANGUAGE', "language=%s", 'language'),
+    )
+    
+    # VOICE_CONFIG report when no parameters are given
+    _CONFIG_INFO_TEMPLATE = "Voice config - enabled: %s, volume: %.1f, speed: %.1f, language: %s"
+    
+    # VOICE_STATUS output: settings part (cached until a setting changes)
+    # and the always-current tail
+    _STATUS_SETTINGS_TEMPLATE = (
+        "Voice Plugin Status:\n"
+        "  Enabled: %s\n"
+        "  Volume: %.1f\n"
+        "  Speed: %.1f\n"
+        "  Language: %s\n"
+        "  Audio Player: %s\n"
+        "  Supported Formats: %s\n")
+    _STATUS_TAIL_TEMPLATE = "  Last announcement: %s\n  Queue length: %d"
+    
+    # Maximum entries held in announcement_queue; once full, appending
+    # drops the oldest entry instead of growing without bound
+    _ANNOUNCEMENT_QUEUE_MAX = 16
+    
+    # Hardware volume arguments per player, built from the 0.0-1.0 volume
+    _VOLUME_BUILDERS = {
+        'ffplay': lambda v: ['-volume', str(int(v * 100))],        # 0-100
+        'ffmpeg': lambda v: ['-filter:a', "volume=%s" % v],        # gain
+        'mpg123': lambda v: ['-g', str(int(v * 100))],             # 0-100
+        'paplay': lambda v: ['--volume', str(int(v * 65536))],     # 0-65536
+        'cvlc': lambda v: ['--volume', str(int(v * 256))],         # 0-256
+    }
+    
+    # Accepted ranges for volume and voice speed, shared by the config
+    # file and the G-code commands
+    _VOLUME_MIN, _VOLUME_MAX = 0.0, 1.0
+    _SPEED_MIN, _SPEED_MAX = 0.5, 2.0
+    
+    # Repeated VOICE_SCAN within this many seconds only rescans if the
+    # audio directory changed
+    _SCAN_DEBOUNCE_TIME = 2.
+    
+    # Seconds a stopped player gets to exit after SIGTERM before SIGKILL
+    _STOP_GRACE_TIME = 2.
+    
+    # Web API endpoints as (path, handler method name)
+    _WEBHOOK_ENDPOINTS = (
+        ('voice/announce', '_handle_announce_request'),
+        ('voice/config', '_handle_config_request'),
+        ('voice/status', '_handle_status_request'),
+    )
+    
     def __init__(self, config):
         """
         Initialize the voice plugin.
@@ -42,6 +172,7 @@ class KlipperVoice:
         """
         # Get printer object reference for accessing other Klipper components
         self.printer = config.get_printer()
+        self.reactor = self.printer.get_reactor()
         
         # Get plugin name from configuration (usually 'klipper_voice')
         self.name = config.get_name()
@@ -51,26 +182,43 @@ class KlipperVoice:
         self.enabled = config.getboolean('enabled', True)
         
         # Volume level (0.0 = mute, 1.0 = maximum)
-        self.volume = config.getfloat('volume', 0.8, minval=0.0, maxval=1.0)
+        self.volume = config.getfloat('volume', 0.8, minval=self._VOLUME_MIN,
+                                     maxval=self._VOLUME_MAX)
         
         # Language code for voice synthesis (e.g., 'en', 'zh', 'es')
         self.language = config.get('language', 'en')
         
         # Voice playback speed (0.5 = slow, 2.0 = fast)
-        self.voice_speed = config.getfloat('voice_speed', 1.0, minval=0.5, maxval=2.0)
+        self.voice_speed = config.getfloat('voice_speed', 1.0, minval=self._SPEED_MIN,
+                                          maxval=self._SPEED_MAX)
         
         # === Audio File Configuration ===
         # Base directory for audio files
         self.audio_base_path = config.get('audio_path', '/home/pi/klipper_voice_files')
         
         # Supported audio formats (auto-detected)
-        self.supported_formats = ['mp3', 'wav', 'ogg', 'flac', 'm4a', 'aac']
+        self.supported_formats = ('mp3', 'wav', 'ogg', 'flac', 'm4a', 'aac')
+        self._supported_formats_csv = ", ".join(self.supported_formats)
+        
+        # Audio filename pattern: <message_type>[.<language>].<format>
+        self._fname_re = re.compile(
+            r'^(?P<type>.+?)(?:\.(?P<lang>[^.]+))?\.(?i:(?P<ext>%s))$'
+            % '|'.join(map(re.escape, self.supported_formats)))
         
         # Audio player priority list (will auto-detect best available)
         self.audio_players = {
+            'ffplay': {
+                'command': 'ffplay',
+                # Skip input probing and buffering so short clips start at once
+                'args': ['-nodisp', '-autoexit', '-fflags', 'nobuffer',
+                         '-flags', 'low_delay', '-probesize', '32',
+                         '-analyzeduration', '0', '-loglevel', 'quiet', '{file}'],
+                'volume_support': True,
+                'formats': ['mp3', 'wav', 'ogg', 'flac', 'm4a', 'aac', 'wma']
+            },
             'ffmpeg': {
                 'command': 'ffmpeg',
-                'args': ['-i', '{file}', '-f', 'alsa', 'default', '-v', 'quiet'],
+                'args': ['-v', 'quiet', '-i', '{file}', '-f', 'alsa', 'default'],
                 'volume_support': True,
                 'formats': ['mp3', 'wav', 'ogg', 'flac', 'm4a', 'aac', 'wma']
             },
@@ -88,7 +236,8 @@ class KlipperVoice:
             },
             'paplay': {
                 'command': 'paplay',
-                'args': ['{file}'],
+                # Ask PulseAudio for a short buffer instead of its default
+                'args': ['--latency-msec=50', '{file}'],
                 'volume_support': True,
                 'formats': ['wav', 'ogg', 'flac']
             },
@@ -103,6 +252,13 @@ class KlipperVoice:
         # Auto-detected audio player (will be set during initialization)
         self.selected_player = None
         
+        # Cached playback command for the selected player, built once at
+        # detection time: argv before and after the file, plus volume args.
+        # Stored pre-encoded as bytes so Popen does not re-encode per play.
+        self._argv_prefix = []
+        self._argv_suffix = []
+        self._volume_args = []
+        
         # Enable hardware volume control through player
         self.use_hardware_volume = config.getboolean('use_hardware_volume', True)
         
@@ -121,6 +277,9 @@ class KlipperVoice:
             'temp_reached': config.get('msg_temp_reached', 'Target temperature reached')
         }
         
+        # Messages are fixed after config load; expose them read-only
+        self.voice_messages = types.MappingProxyType(self.voice_messages)
+        
         # === Auto-announcement Settings ===
         # Control which events trigger automatic announcements
         self.auto_announce = {
@@ -134,41 +293,131 @@ class KlipperVoice:
             'ready': config.getboolean('auto_ready', True)
         }
         
+        # Message type list for error messages; voice_messages is static
+        self._available_types_str = ", ".join(self.voice_messages.keys())
+        
+        # Membership-only set of message types accepted by VOICE_TEST
+        self._valid_test_types = frozenset(self.voice_messages)
+        
+        # === Static Status ===
+        # Status fields that never change after init, merged into every
+        # get_status() result instead of being rebuilt per poll
+        self._static_status = {
+            'auto_announce': self.auto_announce,
+            'available_messages': tuple(self.voice_messages.keys()),
+            'supported_formats': self.supported_formats,
+            'available_players': tuple(self.audio_players.keys())
+        }
+        
         # === State Tracking Variables ===
         # Track the last announcement to prevent duplicates
         self.last_announcement = None
         
-        # Timestamp of last announcement for rate limiting
+        # Wall-clock timestamp of last announcement, reported through the API
         self.last_announcement_time = 0
         
         # Minimum time between announcements (prevents spam)
         self.min_announcement_interval = config.getfloat('min_interval', 2.0, minval=0.1)
         
+        # Monotonic deadline before which announcements are blocked; immune
+        # to NTP/clock adjustments. Infinite while the plugin is disabled.
+        self._next_allowed_time = 0.0 if self.enabled else float('inf')
+        
+        # Monotonic time of the last announcement, used to drop repeats of
+        # the same predefined message within twice the minimum interval
+        self._last_same_type_time = 0.0
+        
+        # Rendered settings part of the VOICE_STATUS report; re-rendered only
+        # after the settings it shows have changed
+        self._status_cache = None
+        self._status_dirty = True
+        
+        # Dict last returned by get_status(); None until rebuilt. Cleared
+        # whenever a field it reports changes.
+        self._status_dict = None
+        
+        # Same for the /voice/status webhook response
+        self._webhook_status = None
+        
         # Queue for managing multiple announcements (future enhancement)
-        self.announcement_queue = []
+        self.announcement_queue = deque(maxlen=self._ANNOUNCEMENT_QUEUE_MAX)
         
         # === Audio Playback State ===
         # Track current playback process
         self.current_playback_process = None
         
-        # Lock for thread-safe audio operations
-        self.playback_lock = threading.Lock()
+        # current_playback_process is only ever swapped as a whole reference,
+        # which is atomic under the GIL, so no lock is needed around it
+        
+        # Set whenever no spawned player process is running
+        self._playback_done = threading.Event()
+        self._playback_done.set()
+        
+        # Persistent mpg123 process in remote control mode (-R), used instead
+        # of spawning a player per announcement when mpg123 is selected
+        self._player_proc = None
+        
+        # Set by the remote player reader when the current file finishes
+        self._player_done = threading.Event()
+        self._player_done.set()
+        
+        # Set by the reader once mpg123 reports the current LOAD as playing;
+        # a '@P 0' seen before that acknowledges an earlier STOP
+        self._player_started = False
         
         # Audio file mapping cache
         self.audio_file_cache = {}
         
+        # Resolved playback paths built from audio_file_cache at scan time:
+        # (message_type, language) -> path, and message_type -> fallback path
+        self._audio_flat = {}
+        self._audio_fallback = {}
+        
+        # Number of audio files in audio_file_cache, counted during the scan
+        self._total_audio_files = 0
+        
+        # Message types found by the last scan, joined for VOICE_SCAN output
+        self._message_types_str = ""
+        
+        # Audio directory mtime at the last scan, used to skip unchanged rescans
+        self._audio_dir_mtime = None
+        
+        # Scan results persisted across restarts, keyed by audio path and
+        # directory mtime. Kept in the state directory of the user running
+        # Klipper, not in the user's audio directory.
+        state_home = os.environ.get('XDG_STATE_HOME') or os.path.expanduser('~/.local/state')
+        self._cache_path = os.path.expanduser(config.get(
+            'cache_file', os.path.join(state_home, 'klipper_voice', 'audio_cache.json')))
+        
+        # Reactor time of the last forced VOICE_SCAN walk
+        self._last_forced_scan = float('-inf')
+        
+        # Pending playback requests, drained by a single long-lived worker
+        self._play_queue = queue.Queue(maxsize=4)
+        
         # === Event Handler Registration ===
         # Register handlers for Klipper system events
         self.printer.register_event_handler("klippy:connect", self.handle_connect)
         self.printer.register_event_handler("klippy:ready", self.handle_ready)
         self.printer.register_event_handler("klippy:shutdown", self.handle_shutdown)
+        self.printer.register_event_handler("klippy:disconnect", self.handle_disconnect)
         
         # === Initialize Logging ===
-        # Create logger instance for this plugin
-        self.logger = logging.getLogger(__name__)
-        
-        # === Initialize Audio System ===
-        self._initialize_audio_system()
+        # Reuse the module logger fetched at import time
+        self.logger = _LOG
+        
+        # === Start Playback Worker ===
+        # One persistent thread serves every announcement instead of
+        # spawning a new thread per playback. It first initializes the audio
+        # system so player detection and the directory scan do not delay
+        # Klipper startup; _init_done is set once that has finished.
+        self._init_done = threading.Event()
+        
+        # Set once the worker has been told to exit; nothing queued after
+        # that would ever be played
+        self._worker_stopped = False
+        self._worker = threading.Thread(target=self._playback_worker, daemon=True)
+        self._worker.start()
         
         self.logger.info("KlipperVoice plugin initialized - enabled: %s, volume: %.1f", 
                         self.enabled, self.volume)
@@ -182,6 +431,7 @@ class KlipperVoice:
         - Validates audio player availability
         - Scans for available audio files
         - Builds audio file cache
+        - Starts the persistent remote player when supported
         """
         # === Create Audio Directory ===
         try:
@@ -195,24 +445,32 @@ class KlipperVoice:
         # === Auto-detect Best Audio Player ===
         self._detect_audio_player()
         
+        # === Start Persistent Player ===
+        if self.selected_player == 'mpg123':
+            self._start_remote_player()
+        
         # === Scan Audio Files ===
         self._scan_audio_files()
+        
+        # Selected player is part of the VOICE_STATUS report
+        self._status_dirty = True
     
     def _detect_audio_player(self):
         """
         Auto-detect the best available audio player.
         
         Priority order:
-        1. ffmpeg (most versatile, supports all formats)
-        2. mpg123 (good for MP3)
-        3. paplay (PulseAudio)
-        4. cvlc (VLC)
-        5. aplay (basic ALSA)
+        1. ffplay (all formats, lowest start latency)
+        2. ffmpeg (most versatile, supports all formats)
+        3. mpg123 (good for MP3)
+        4. paplay (PulseAudio)
+        5. cvlc (VLC)
+        6. aplay (basic ALSA)
         
         Sets self.selected_player to the best available option.
         """
         # Priority order for audio players
-        priority_order = ['ffmpeg', 'mpg123', 'paplay', 'cvlc', 'aplay']
+        priority_order = ['ffplay', 'ffmpeg', 'mpg123', 'paplay', 'cvlc', 'aplay']
         
         for player_name in priority_order:
             if player_name not in self.audio_players:
@@ -221,22 +479,22 @@ class KlipperVoice:
             player_config = self.audio_players[player_name]
             command = player_config['command']
             
-            try:
-                # Check if the command is available
-                result = subprocess.run(['which', command], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    self.selected_player = player_name
-                    self.logger.info("Selected audio player: %s (%s)", 
-                                   player_name, command)
-                    self.logger.info("Supported formats: %s", 
-                                   ', '.join(player_config['formats']))
-                    return
-            except Exception as e:
-                self.logger.debug("Error checking %s: %s", command, str(e))
+            # Check if the command is available
+            player_path = _find_binary(command)
+            if player_path:
+                self.selected_player = player_name
+                self._build_player_argv(player_path)
+                self.logger.info("Selected audio player: %s (%s)", 
+                               player_name, player_path)
+                self.logger.info("Supported formats: %s", 
+                               ', '.join(player_config['formats']))
+                return
         
         # No audio player found
         self.selected_player = None
+        self._argv_prefix = []
+        self._argv_suffix = []
+        self._volume_args = []
         self.logger.warning("No audio player found. Available players: %s", 
                           ', '.join(priority_order))
         self.logger.warning("Voice announcements will be logged only")
@@ -246,54 +504,348 @@ class KlipperVoice:
         self.logger.info("  sudo apt install pulseaudio-utils")
         self.logger.info("  sudo apt install vlc")
     
-    def _scan_audio_files(self):
+    def _start_remote_player(self):
+        """
+        Launch mpg123 in remote control mode.
+        
+        The process stays alive for the lifetime of the plugin and receives
+        LOAD/STOP commands on stdin, avoiding a fork/exec per announcement.
+        A reader thread watches stdout for playback status messages.
+        """
+        try:
+            self._player_proc = subprocess.Popen(
+                [self._argv_prefix[0], '-R', '--quiet'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+        except Exception as e:
+            self._player_proc = None
+            self.logger.warning("Failed to start mpg123 remote player: %s", str(e))
+            return
+        
+        reader = threading.Thread(target=self._remote_player_reader,
+                                  args=(self._player_proc,), daemon=True)
+        reader.start()
+        
+        # Suppress per-frame progress messages
+        self._send_remote_command(b'SILENCE')
+        self.logger.info("Started mpg123 remote player (pid %d)", self._player_proc.pid)
+    
+    def _remote_player_reader(self, proc):
+        """
+        Drain remote player output and track playback completion.
+        
+        Args:
+            proc: The mpg123 remote control process
+            
+        Runs in a daemon thread. '@P 2' marks the start of the loaded file,
+        '@P 0' the end of playback and '@E' reports an error; the latter two
+        release the waiting playback worker.
+        """
+        for line in proc.stdout:
+            if line.startswith(b'@P 2'):
+                self._player_started = True
+            elif line.startswith(b'@P 0'):
+                # mpg123 answers commands in order, so a stop seen before the
+                # current file started belongs to an earlier STOP; ignore it
+                if self._player_started:
+                    self._player_started = False
+                    self._player_done.set()
+            elif line.startswith(b'@E'):
+                self.logger.warning("Audio error output: %s",
+                                    line[2:].strip().decode(errors='replace'))
+                self._player_done.set()
+        
+        # Player exited; never leave the worker waiting
+        self._player_done.set()
+    
+    def _send_remote_command(self, command):
+        """
+        Send a command line to the remote player.
+        
+        Args:
+            command (bytes): mpg123 remote control command
+            
+        Returns:
+            bool: True if the command was written, False if the player is gone
+        """
+        proc = self._player_proc
+        if proc is None or proc.poll() is not None:
+            return False
+        try:
+            proc.stdin.write(command + b'\n')
+            return True
+        except (BrokenPipeError, OSError) as e:
+            self.logger.warning("mpg123 remote player unavailable: %s", str(e))
+            self._player_proc = None
+            return False
+    
+    def _stop_remote_player(self):
+        """
+        Shut down the remote player process, if running.
+        """
+        proc = self._player_proc
+        if proc is None:
+            return
+        self._send_remote_command(b'QUIT')
+        self._player_proc = None
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    
+    def _build_player_argv(self, player_path):
+        """
+        Precompute the playback command for the selected player.
+        
+        Args:
+            player_path (str): Absolute path to the player executable
+            
+        Splits the configured arguments around the {file} placeholder so
+        playback only has to insert the audio file path.
+        """
+        args = self.audio_players[self.selected_player]['args']
+        file_index = args.index('{file}')
+        self._argv_prefix = [os.fsencode(arg) for arg in [player_path] + args[:file_index]]
+        self._argv_suffix = [os.fsencode(arg) for arg in args[file_index + 1:]]
+        self._update_volume_args()
+    
+    def _update_volume_args(self):
+        """
+        Rebuild the cached volume arguments for the selected player.
+        
+        Must be called whenever self.volume changes.
+        """
+        # Swap in a complete list so the playback worker never sees a partial one
+        self._volume_args = self._build_volume_args(self.volume)
+    
+    def _build_volume_args(self, volume):
+        """
+        Build encoded volume arguments for the selected player.
+        
+        Args:
+            volume (float): Volume level (0.0-1.0)
+            
+        Returns:
+            list: Encoded arguments, empty if hardware volume is not used
+        """
+        builder = None
+        if self.selected_player and self.use_hardware_volume and \
+                self.audio_players[self.selected_player]['volume_support']:
+            builder = self._VOLUME_BUILDERS.get(self.selected_player)
+        
+        return [arg.encode() for arg in builder(volume)] if builder else []
+    
+    def _scan_audio_files(self, force=False):
         """
         Scan audio directory for available files and build cache.
         
+        Args:
+            force (bool): Walk the directory even if it looks unchanged
+            
         Creates mapping between message types and audio file paths.
         Expected filename format: <message_type>.<language>.<format>
         Example: print_start.en.mp3, print_end.zh.mp3
-        """
-        self.audio_file_cache = {}
         
-        if not os.path.exists(self.audio_base_path):
+        Unless forced, the walk is skipped when the directory has not changed
+        since the previous scan, either in this session or as recorded in
+        the on-disk cache file.
+        
+        Only the directory mtime is compared, so a file replaced in place
+        under the same name is not noticed; that is harmless since only
+        names are cached. On filesystems with coarse timestamps (FAT/exFAT)
+        changes within one timestamp tick can be missed until VOICE_SCAN.
+        """
+        try:
+            dir_mtime = os.stat(self.audio_base_path).st_mtime_ns
+        except OSError:
+            self.audio_file_cache = {}
+            self._audio_flat = {}
+            self._audio_fallback = {}
+            self._total_audio_files = 0
+            self._message_types_str = ""
+            self._audio_dir_mtime = None
             self.logger.warning("Audio directory does not exist: %s", self.audio_base_path)
             return
         
+        if not force:
+            if dir_mtime == self._audio_dir_mtime:
+                self.logger.debug("Audio directory unchanged, keeping cached scan")
+                return
+            if self._load_audio_cache(dir_mtime):
+                return
+        
+        cache = {}
+        total_files = 0
+        
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        
         try:
-            for filename in os.listdir(self.audio_base_path):
-                # Check if file has supported format
-                file_ext = filename.split('.')[-1].lower()
-                if file_ext not in self.supported_formats:
-                    continue
-                
-                # Parse filename: message_type.language.format
-                name_parts = filename.rsplit('.', 2)
-                if len(name_parts) >= 2:
-                    message_type = name_parts[0]
-                    language = name_parts[1] if len(name_parts) == 3 else 'default'
-                    format_ext = name_parts[-1].lower()
+            with os.scandir(self.audio_base_path) as entries:
+                for entry in entries:
+                    # Parse filename: message_type.language.format
+                    match = self._fname_re.match(entry.name)
+                    if not match:
+                        continue
+                    
+                    # Skip directories; file type comes from the directory entry
+                    if not entry.is_file():
+                        continue
                     
-                    # Build file path
-                    file_path = os.path.join(self.audio_base_path, filename)
+                    message_type = match.group('type')
+                    language = match.group('lang') or 'default'
+                    format_ext = match.group('ext').lower()
+                    file_path = entry.path
                     
                     # Store in cache with format info
-                    if message_type not in self.audio_file_cache:
-                        self.audio_file_cache[message_type] = {}
-                    if language not in self.audio_file_cache[message_type]:
-                        self.audio_file_cache[message_type][language] = {}
+                    type_files = cache.get(message_type)
+                    if type_files is None:
+                        type_files = cache[message_type] = {}
+                    format_files = type_files.get(language)
+                    if format_files is None:
+                        format_files = type_files[language] = {}
                     
-                    self.audio_file_cache[message_type][language][format_ext] = file_path
+                    if format_ext not in format_files:
+                        total_files += 1
+                    format_files[format_ext] = file_path
                     
-                    self.logger.debug("Found audio file: %s -> %s (%s, %s)", 
-                                    message_type, file_path, language, format_ext)
+                    if debug_enabled:
+                        self.logger.debug("Found audio file: %s -> %s (%s, %s)", 
+                                        message_type, file_path, language, format_ext)
             
+            self.audio_file_cache = cache
+            self._finish_scan(dir_mtime, total_files)
+            self._save_audio_cache(dir_mtime)
             self.logger.info("Audio file scan complete. Found %d message types", 
                            len(self.audio_file_cache))
             
         except Exception as e:
             self.logger.error("Error scanning audio files: %s", str(e))
     
+    def _finish_scan(self, dir_mtime, total_files):
+        """
+        Update derived scan state after audio_file_cache has been rebuilt.
+        
+        Args:
+            dir_mtime (int): Directory st_mtime_ns the cache corresponds to
+            total_files (int): Number of files in audio_file_cache
+        """
+        self._total_audio_files = total_files
+        self._message_types_str = ", ".join(self.audio_file_cache.keys())
+        self._build_audio_lookup()
+        self._audio_dir_mtime = dir_mtime
+    
+    def _load_audio_cache(self, dir_mtime):
+        """
+        Load scan results from the on-disk cache file.
+        
+        Args:
+            dir_mtime (int): Current directory st_mtime_ns
+            
+        Returns:
+            bool: True if a cache matching audio_base_path and dir_mtime
+            was loaded
+            
+        The file stores bare file names, joined here with audio_base_path.
+        A cache written for another audio directory is never used, and
+        anything that does not have the expected shape is rejected; the
+        caller then falls back to a scan.
+        """
+        try:
+            with open(self._cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if not isinstance(data, dict) or data.get('path') != self.audio_base_path \
+                or data.get('mtime') != dir_mtime \
+                or not isinstance(data.get('cache'), dict) \
+                or not isinstance(data.get('total'), int):
+            return False
+        
+        base_path = self.audio_base_path
+        cache = {}
+        total_files = 0
+        for message_type, language_files in data['cache'].items():
+            if not isinstance(language_files, dict) or not language_files:
+                return False
+            type_files = cache[message_type] = {}
+            for language, format_files in language_files.items():
+                if not isinstance(format_files, dict) or not format_files:
+                    return False
+                paths = type_files[language] = {}
+                for format_ext, name in format_files.items():
+                    # Bare names only; older caches held absolute paths
+                    if not isinstance(name, str) or not name or \
+                            os.path.basename(name) != name:
+                        return False
+                    paths[format_ext] = os.path.join(base_path, name)
+                    total_files += 1
+        if total_files != data['total']:
+            return False
+        
+        self.audio_file_cache = cache
+        self._finish_scan(dir_mtime, total_files)
+        self.logger.info("Loaded audio file cache. Found %d message types", 
+                       len(self.audio_file_cache))
+        return True
+    
+    def _save_audio_cache(self, dir_mtime):
+        """
+        Write scan results to the on-disk cache file.
+        
+        Args:
+            dir_mtime (int): Directory st_mtime_ns the cache corresponds to
+            
+        Only file names are stored, together with the audio directory they
+        belong to; see _load_audio_cache.
+        """
+        names = {message_type: {language: {format_ext: os.path.basename(path)
+                                           for format_ext, path in format_files.items()}
+                                for language, format_files in language_files.items()}
+                 for message_type, language_files in self.audio_file_cache.items()}
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(self._cache_path, 'w') as f:
+                json.dump({'path': self.audio_base_path, 'mtime': dir_mtime,
+                           'total': self._total_audio_files, 'cache': names}, f)
+        except OSError as e:
+            self.logger.debug("Could not write audio file cache: %s", str(e))
+    
+    def _build_audio_lookup(self):
+        """
+        Resolve audio_file_cache into flat playback lookup tables.
+        
+        Picks the best format for the selected player for every
+        (message_type, language) pair, and a fallback file per message type
+        following English -> default -> any available language. Paths are
+        stored encoded as bytes, ready to be passed to the player.
+        """
+        # Get supported formats for current player
+        if self.selected_player:
+            supported_formats = self.audio_players[self.selected_player]['formats']
+        else:
+            supported_formats = self.supported_formats
+        
+        audio_flat = {}
+        audio_fallback = {}
+        for message_type, language_files in self.audio_file_cache.items():
+            for language, format_files in language_files.items():
+                audio_flat[(message_type, language)] = os.fsencode(
+                    self._get_best_format_file(format_files, supported_formats))
+            
+            fallback = (audio_flat.get((message_type, 'en'))
+                        or audio_flat.get((message_type, 'default')))
+            if not fallback:
+                fallback = next((audio_flat[(message_type, language)]
+                                 for language in language_files), None)
+            audio_fallback[message_type] = fallback
+        
+        self._audio_flat = audio_flat
+        self._audio_fallback = audio_fallback
+    
     def handle_connect(self):
         """
         Handle Klipper connection event.
@@ -306,25 +858,17 @@ class KlipperVoice:
         gcode = self.printer.lookup_object('gcode')
         
         # Register voice control commands
-        gcode.register_command("VOICE_ANNOUNCE", self.cmd_VOICE_ANNOUNCE,
-                              desc=self.cmd_VOICE_ANNOUNCE_help)
-        gcode.register_command("VOICE_CONFIG", self.cmd_VOICE_CONFIG,
-                              desc=self.cmd_VOICE_CONFIG_help)
-        gcode.register_command("VOICE_STATUS", self.cmd_VOICE_STATUS,
-                              desc=self.cmd_VOICE_STATUS_help)
-        gcode.register_command("VOICE_TEST", self.cmd_VOICE_TEST,
-                              desc=self.cmd_VOICE_TEST_help)
-        gcode.register_command("VOICE_SCAN", self.cmd_VOICE_SCAN,
-                              desc=self.cmd_VOICE_SCAN_help)
+        for name, attr in self._GCODE_CMDS:
+            gcode.register_command(name, getattr(self, attr),
+                                   desc=getattr(self, attr + '_help', ''))
         
         # === Register Web API Endpoints ===
         # Get webhooks object for API endpoint registration
         webhooks = self.printer.lookup_object('webhooks')
         
         # Register REST API endpoints for remote control
-        webhooks.register_endpoint("voice/announce", self._handle_announce_request)
-        webhooks.register_endpoint("voice/config", self._handle_config_request)
-        webhooks.register_endpoint("voice/status", self._handle_status_request)
+        for path, attr in self._WEBHOOK_ENDPOINTS:
+            webhooks.register_endpoint(path, getattr(self, attr))
         
         # === Register Print Event Handlers ===
         # Try to register with virtual_sdcard for print events
@@ -356,10 +900,44 @@ class KlipperVoice:
         Called when Klipper is shutting down. Cleanup any resources if needed.
         """
         # === Stop Current Playback ===
+        # The reactor keeps running in the shutdown state, so the SIGKILL
+        # fallback timer still fires; the worker quits the remote player
         self._stop_current_playback()
+        self._stop_playback_worker()
         
         self.logger.info("KlipperVoice shutting down")
     
+    def handle_disconnect(self):
+        """
+        Handle Klipper disconnect event.
+        
+        Sent on RESTART, FIRMWARE_RESTART and exit, which do not raise
+        klippy:shutdown. Stops playback and the playback worker, which quits
+        the remote player on exit, so none of them outlive this plugin
+        instance.
+        """
+        # The process may be about to exit before a reactor timer could
+        # kill a player that ignores SIGTERM, so wait for it here
+        self._stop_current_playback(wait=True)
+        self._stop_playback_worker()
+    
+    def _stop_playback_worker(self):
+        """
+        Ask the playback worker thread to exit.
+        
+        Safe to call more than once; a shutdown is followed by a disconnect
+        on the next restart.
+        """
+        self._worker_stopped = True
+        if not self._worker.is_alive():
+            return
+        # Sentinel tells the worker to exit its loop
+        try:
+            self._play_queue.put_nowait(None)
+        except queue.Full:
+            self._drop_oldest_playback()
+            self._play_queue.put_nowait(None)
+    
     def _can_announce(self):
         """
         Check if announcement is allowed based on timing and state.
@@ -371,36 +949,39 @@ class KlipperVoice:
             - Plugin is enabled
             - Minimum interval has passed since last announcement
         """
-        # Check if plugin is globally enabled
-        if not self.enabled:
-            return False
-        
-        # Check minimum interval to prevent spam
-        current_time = time.time()
-        if (current_time - self.last_announcement_time) < self.min_announcement_interval:
-            return False
-        
-        return True
+        # Disabled state and rate limiting are both folded into one deadline
+        return time.monotonic() >= self._next_allowed_time
     
-    def _announce_message(self, message_type, custom_message=None):
+    def _announce_message(self, message_type, custom_message=None, volume=None):
         """
         Core announcement function - handles all voice announcements.
         
         Args:
             message_type (str): Type of message (e.g., 'print_start', 'print_end')
             custom_message (str, optional): Custom message text to override default
+            volume (float, optional): Volume for this announcement only,
+                instead of the configured volume
             
         Returns:
             bool: True if announcement was made, False if blocked
             
         This is the main function that processes all voice announcements.
-        It handles rate limiting, message retrieval, and audio output simulation.
+        It handles rate limiting, message retrieval, and audio playback.
         """
         # Check if announcement is allowed (rate limiting, enabled state)
         if not self._can_announce():
             self.logger.debug("Announcement blocked - too frequent or disabled")
             return False
         
+        # === Duplicate Suppression ===
+        # Drop back-to-back repeats of the same predefined message, e.g. from
+        # bursty print_stats or filament sensor events
+        now = time.monotonic()
+        if custom_message is None and message_type == self.last_announcement and \
+                (now - self._last_same_type_time) < 2 * self.min_announcement_interval:
+            self.logger.debug("Announcement blocked - repeated %s", message_type)
+            return False
+        
         # === Message Text Retrieval ===
         # Use custom message if provided, otherwise use predefined message
         if custom_message:
@@ -411,46 +992,32 @@ class KlipperVoice:
         # === Logging for Debug/Testing ===
         # Log the announcement with all parameters for testing
         self.logger.info("VOICE ANNOUNCEMENT [%s]: %s (volume: %.1f, speed: %.1f, lang: %s)", 
-                        message_type.upper(), message_text, self.volume, self.voice_speed, self.language)
+                         message_type.upper(), message_text,
+                         self.volume if volume is None else volume,
+                         self.voice_speed, self.language)
         
         # === State Updates ===
         # Update tracking variables
         self.last_announcement = message_type
         self.last_announcement_time = time.time()
+        self._status_dict = None
+        self._webhook_status = None
+        self._last_same_type_time = now
+        self._next_allowed_time = now + self.min_announcement_interval
         
         # === Audio Output ===
-        # Play actual audio file or fall back to simulation
-        audio_played = self._play_audio_file(message_type)
-        
-        # Keep simulation for logging and fallback
-        self._simulate_audio_output(message_text)
+        # Play actual audio file; the log line above covers the no-audio case
+        self._play_audio_file(message_type, volume)
         
         return True
     
-    def _simulate_audio_output(self, message):
-        """
-        Play actual audio output using predefined audio files.
-        
-        Args:
-            message (str): The message text (for logging purposes)
-            
-        This function handles the actual audio playback using pre-recorded
-        audio files. It falls back to logging if audio files are not available.
-        """
-        # Log the message for debugging
-        self.logger.info("🔊 AUDIO OUTPUT: '%s'", message)
-        self.logger.debug("Audio settings - Volume: %.1f, Speed: %.1f, Language: %s", 
-                         self.volume, self.voice_speed, self.language)
-        
-        # Note: The actual audio file selection is handled in _play_audio_file
-        # This method is kept for compatibility and logging
-    
-    def _play_audio_file(self, message_type):
+    def _play_audio_file(self, message_type, volume=None):
         """
         Play audio file for the specified message type.
         
         Args:
             message_type (str): Type of message to play
+            volume (float, optional): Volume override, None for the configured volume
             
         Returns:
             bool: True if audio was played successfully, False otherwise
@@ -458,34 +1025,93 @@ class KlipperVoice:
         This method:
         - Finds appropriate audio file for message type and language
         - Stops any current playback
-        - Starts new audio playback in background thread
+        - Queues the file for the background playback worker
         - Handles volume control
         """
-        # === Find Audio File ===
-        audio_file = self._get_audio_file_path(message_type)
-        if not audio_file:
-            self.logger.debug("No audio file found for message type: %s", message_type)
+        # Nothing drains the queue once the worker has been stopped
+        if self._worker_stopped:
+            self.logger.debug("Playback stopped, not playing: %s", message_type)
             return False
         
+        # === Find Audio File ===
+        # Until the worker has scanned the audio directory the lookup is
+        # empty; queue the request and let the worker resolve it after init
+        audio_file = None
+        if self._init_done.is_set():
+            audio_file = self._get_audio_file_path(message_type)
+            if not audio_file:
+                self.logger.debug("No audio file found for message type: %s", message_type)
+                return False
+        
         # === Stop Current Playback ===
         self._stop_current_playback()
         
-        # === Start New Playback ===
+        # === Queue New Playback ===
+        item = (audio_file, message_type, volume)
         try:
-            # Start playback in background thread
-            playback_thread = threading.Thread(
-                target=self._execute_audio_playback, 
-                args=(audio_file, message_type),
-                daemon=True
-            )
-            playback_thread.start()
-            
-            self.logger.info("Started audio playback: %s -> %s", message_type, audio_file)
-            return True
-            
-        except Exception as e:
-            self.logger.error("Failed to start audio playback: %s", str(e))
-            return False
+            self._play_queue.put_nowait(item)
+        except queue.Full:
+            # Drop the oldest pending announcement to make room
+            self._drop_oldest_playback()
+            try:
+                self._play_queue.put_nowait(item)
+            except queue.Full:
+                self.logger.warning("Playback queue full, dropping: %s", message_type)
+                return False
+        
+        # The announcement itself is already logged at INFO by the caller
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Queued audio playback: %s -> %s", message_type,
+                              os.fsdecode(audio_file) if audio_file else "pending")
+        return True
+    
+    def _drop_oldest_playback(self):
+        """
+        Discard the oldest pending playback request, if any.
+        """
+        try:
+            dropped = self._play_queue.get_nowait()
+        except queue.Empty:
+            return
+        if dropped is not None:
+            self.logger.debug("Dropped pending audio playback: %s", dropped[1])
+    
+    def _playback_worker(self):
+        """
+        Playback worker loop.
+        
+        Runs in a single daemon thread for the lifetime of the plugin.
+        Initializes the audio system, then pulls (audio_file, message_type,
+        volume) tuples from the playback queue and plays them one at a time.
+        Items queued before init finished carry no audio_file and are
+        resolved here. A None item stops the worker.
+        """
+        # A failed init must not take the only playback thread down with it;
+        # log it to klippy.log and keep serving the queue
+        try:
+            self._initialize_audio_system()
+        except Exception:
+            self.logger.exception("Audio system initialization failed")
+        finally:
+            self._init_done.set()
+        
+        while True:
+            item = self._play_queue.get()
+            if item is None:
+                break
+            audio_file, message_type, volume = item
+            if audio_file is None:
+                audio_file = self._get_audio_file_path(message_type)
+                if not audio_file:
+                    self.logger.debug("No audio file found for message type: %s",
+                                      message_type)
+                    continue
+            self._execute_audio_playback(audio_file, message_type, volume)
+        
+        # Quit the remote player here rather than on the reactor thread. This
+        # also covers a player started by an init that finished after the
+        # shutdown or disconnect that stopped the worker.
+        self._stop_remote_player()
     
     def _get_audio_file_path(self, message_type):
         """
@@ -495,44 +1121,19 @@ class KlipperVoice:
             message_type (str): Type of message
             
         Returns:
-            str: Path to audio file, or None if not found
+            bytes: Encoded path to audio file, or None if not found
             
         Lookup priority:
         1. message_type.current_language.supported_format
         2. message_type.en.supported_format (fallback to English)
         3. message_type.default.supported_format (generic fallback)
         4. Any available file
-        """
-        if message_type not in self.audio_file_cache:
-            return None
-        
-        language_files = self.audio_file_cache[message_type]
-        
-        # Get supported formats for current player
-        if self.selected_player:
-            supported_formats = self.audio_players[self.selected_player]['formats']
-        else:
-            supported_formats = self.supported_formats
-        
-        # Try current language first
-        if self.language in language_files:
-            return self._get_best_format_file(language_files[self.language], supported_formats)
-        
-        # Fallback to English
-        if 'en' in language_files:
-            return self._get_best_format_file(language_files['en'], supported_formats)
-        
-        # Fallback to default
-        if 'default' in language_files:
-            return self._get_best_format_file(language_files['default'], supported_formats)
         
-        # Use any available file
-        for lang_formats in language_files.values():
-            result = self._get_best_format_file(lang_formats, supported_formats)
-            if result:
-                return result
-        
-        return None
+        Formats and fallbacks are resolved at scan time, so this is a
+        lookup keyed by the live language setting.
+        """
+        return (self._audio_flat.get((message_type, self.language))
+                or self._audio_fallback.get(message_type))
     
     def _get_best_format_file(self, format_files, supported_formats):
         """
@@ -540,7 +1141,7 @@ class KlipperVoice:
         
         Args:
             format_files (dict): Dictionary of format -> file_path
-            supported_formats (list): List of supported formats
+            supported_formats (sequence): Supported formats, most preferred first
             
         Returns:
             str: Path to best format file, or None if not found
@@ -556,110 +1157,163 @@ class KlipperVoice:
         
         return None
     
-    def _execute_audio_playback(self, audio_file, message_type):
+    def _execute_audio_playback(self, audio_file, message_type, volume=None):
         """
-        Execute audio playback in background thread.
+        Execute audio playback on the playback worker thread.
         
         Args:
-            audio_file (str): Path to audio file
+            audio_file (bytes): Encoded path to audio file
             message_type (str): Message type for logging
+            volume (float, optional): Volume override, None for the configured volume
             
-        This method runs in a separate thread to avoid blocking Klipper.
+        This method runs on the playback worker to avoid blocking Klipper.
         It handles the actual subprocess execution for audio playback.
         """
-        with self.playback_lock:
-            try:
-                if not self.selected_player:
-                    self.logger.warning("No audio player available for playback")
-                    return
-                
-                player_config = self.audio_players[self.selected_player]
-                
-                # Build command from player configuration
-                cmd = [player_config['command']]
-                
-                # Process arguments and replace {file} placeholder
-                for arg in player_config['args']:
-                    if '{file}' in arg:
-                        cmd.append(arg.replace('{file}', audio_file))
-                    else:
-                        cmd.append(arg)
-                
-                # Add volume control if supported
-                if self.use_hardware_volume and player_config['volume_support']:
-                    if self.selected_player == 'ffmpeg':
-                        # FFmpeg volume control: -filter:a "volume=0.8"
-                        volume_filter = f"volume={self.volume}"
-                        cmd.extend(['-filter:a', volume_filter])
-                    elif self.selected_player == 'mpg123':
-                        # mpg123 volume control: -g <gain> (0-100)
-                        gain = int(self.volume * 100)
-                        cmd.extend(['-g', str(gain)])
-                    elif self.selected_player == 'paplay':
-                        # paplay volume control: --volume <0-65536>
-                        volume = int(self.volume * 65536)
-                        cmd.extend(['--volume', str(volume)])
-                    elif self.selected_player == 'cvlc':
-                        # VLC volume control: --volume <0-256>
-                        volume = int(self.volume * 256)
-                        cmd.extend(['--volume', str(volume)])
-                
-                self.logger.debug("Executing audio command: %s", ' '.join(cmd))
-                
-                # Execute playback
-                self.current_playback_process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                # Wait for completion
-                stdout, stderr = self.current_playback_process.communicate(timeout=30)
-                
-                if self.current_playback_process.returncode == 0:
-                    self.logger.debug("Audio playback completed: %s", message_type)
-                else:
-                    self.logger.warning("Audio playback failed: %s (return code: %d)", 
-                                      message_type, self.current_playback_process.returncode)
-                    if stderr:
-                        self.logger.warning("Audio error output: %s", stderr.strip())
-                
-            except subprocess.TimeoutExpired:
-                self.logger.warning("Audio playback timeout: %s", message_type)
-                if self.current_playback_process:
-                    self.current_playback_process.kill()
+        proc = None
+        try:
+            if not self.selected_player:
+                self.logger.warning("No audio player available for playback")
+                return
             
-            except Exception as e:
-                self.logger.error("Audio playback error: %s - %s", message_type, str(e))
+            # Prefer the persistent remote player when it is running
+            if self._player_proc is not None and \
+                    self._execute_remote_playback(audio_file, message_type, volume):
+                return
+            
+            # Build command from the cached player argv; volume goes before
+            # the suffix so ffmpeg applies it to its output
+            if volume is None:
+                volume_args = self._volume_args
+            else:
+                volume_args = self._build_volume_args(volume)
+            cmd = self._argv_prefix + [audio_file] + volume_args + self._argv_suffix
             
-            finally:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Executing audio command: %s", os.fsdecode(b' '.join(cmd)))
+            
+            # Execute playback. cmd[0] is an absolute path and close_fds is
+            # off, which lets subprocess launch via os.posix_spawn instead
+            # of fork+exec; Python's own fds are non-inheritable anyway.
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                close_fds=False
+            )
+            self._playback_done.clear()
+            self.current_playback_process = proc
+            
+            # Wait for completion
+            stdout, stderr = proc.communicate(timeout=30)
+            
+            if proc.returncode == 0:
+                self.logger.debug("Audio playback completed: %s", message_type)
+            else:
+                self.logger.warning("Audio playback failed: %s (return code: %d)", 
+                                    message_type, proc.returncode)
+                if stderr:
+                    self.logger.warning("Audio error output: %s",
+                                        stderr.decode(errors='replace').strip())
+            
+        except subprocess.TimeoutExpired:
+            self.logger.warning("Audio playback timeout: %s", message_type)
+            if proc:
+                proc.kill()
+        
+        except Exception as e:
+            self.logger.error("Audio playback error: %s - %s", message_type, str(e))
+        
+        finally:
+            if self.current_playback_process is proc:
                 self.current_playback_process = None
+            self._playback_done.set()
+    
+    def _execute_remote_playback(self, audio_file, message_type, volume=None):
+        """
+        Play an audio file through the persistent remote player.
+        
+        Args:
+            audio_file (bytes): Encoded path to audio file
+            message_type (str): Message type for logging
+            volume (float, optional): Volume override, None for the configured volume
+            
+        Returns:
+            bool: True if the remote player handled playback, False if the
+            caller should fall back to spawning a player process
+        """
+        self._player_started = False
+        self._player_done.clear()
+        
+        if self.use_hardware_volume:
+            if volume is None:
+                volume = self.volume
+            self._send_remote_command(b'VOLUME %d' % int(volume * 100))
+        if not self._send_remote_command(b'LOAD ' + audio_file):
+            self._player_done.set()
+            return False
+        
+        # Wait for completion
+        if self._player_done.wait(timeout=30):
+            self.logger.debug("Audio playback completed: %s", message_type)
+        else:
+            self.logger.warning("Audio playback timeout: %s", message_type)
+            self._send_remote_command(b'STOP')
+            self._player_done.set()
+        return True
     
-    def _stop_current_playback(self):
+    def _stop_current_playback(self, wait=False):
         """
         Stop any currently running audio playback.
         
+        Args:
+            wait (bool): Block until the process has exited instead of
+                scheduling the SIGKILL fallback on the reactor
+        
         This method safely terminates the current audio playback process
         to prevent overlapping audio announcements.
         """
-        if self.current_playback_process and self.current_playback_process.poll() is None:
+        # Remote player: stop the loaded file but keep the process alive
+        if not self._player_done.is_set():
+            self._send_remote_command(b'STOP')
+        
+        # Take the reference and clear it; work on the local from here on
+        proc = self.current_playback_process
+        self.current_playback_process = None
+        
+        if proc and proc.poll() is None:
             try:
                 self.logger.debug("Stopping current audio playback")
-                self.current_playback_process.terminate()
+                proc.terminate()
                 
-                # Give it a moment to terminate gracefully
-                try:
-                    self.current_playback_process.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    # Force kill if it doesn't terminate
-                    self.current_playback_process.kill()
+                if wait:
+                    # Give it a moment to terminate gracefully; the playback
+                    # worker signals once the process has been reaped
+                    if not self._playback_done.wait(timeout=self._STOP_GRACE_TIME):
+                        # Force kill if it doesn't terminate
+                        proc.kill()
+                else:
+                    # Don't hold up the caller; the worker reaps the process
+                    # and a reactor timer kills it if SIGTERM was ignored
+                    self.reactor.register_callback(
+                        lambda eventtime: self._kill_playback_process(proc),
+                        self.reactor.monotonic() + self._STOP_GRACE_TIME)
                     
             except Exception as e:
                 self.logger.warning("Error stopping audio playback: %s", str(e))
-            
-            finally:
-                self.current_playback_process = None
+    
+    def _kill_playback_process(self, proc):
+        """
+        Force kill a stopped playback process that is still running.
+        
+        Args:
+            proc (subprocess.Popen): Process previously sent SIGTERM
+        """
+        if proc.poll() is None:
+            self.logger.debug("Audio player ignored SIGTERM, killing it")
+            try:
+                proc.kill()
+            except OSError:
+                pass
     
     def _handle_print_event(self, event_name, event_data):
         """
@@ -695,11 +1349,10 @@ class KlipperVoice:
         Handle webhook announcement requests.
         
         Args:
-            web_request (dict): Web request data containing message info
-            
-        Returns:
-            dict: Response with success status and message details
+            web_request: Klipper WebRequest containing message info
             
+        Replies with the success status and message details.
+        
         Web API endpoint: POST /voice/announce
         Expected parameters:
         - type: message type (optional, default: 'custom')
@@ -710,51 +1363,49 @@ class KlipperVoice:
         
         if message_text:
             success = self._announce_message(message_type, message_text)
-            return {'success': success, 'message': message_text}
+            web_request.send({'success': success, 'message': message_text})
         else:
-            return {'success': False, 'error': 'No message provided'}
+            web_request.send({'success': False, 'error': 'No message provided'})
     
     def _handle_config_request(self, web_request):
         """
         Handle webhook configuration requests.
         
         Args:
-            web_request (dict): Web request data
-            
-        Returns:
-            dict: Current plugin configuration
+            web_request: Klipper WebRequest
             
         Web API endpoint: GET /voice/config
-        Returns all current voice plugin settings.
+        Replies with all current voice plugin settings.
         """
-        return {
+        web_request.send({
             'enabled': self.enabled,
             'volume': self.volume,
             'language': self.language,
             'voice_speed': self.voice_speed,
             'auto_announce': self.auto_announce,
-            'voice_messages': self.voice_messages
-        }
+            'voice_messages': dict(self.voice_messages)
+        })
     
     def _handle_status_request(self, web_request):
         """
         Handle webhook status requests.
         
         Args:
-            web_request (dict): Web request data
-            
-        Returns:
-            dict: Current plugin status information
+            web_request: Klipper WebRequest
             
         Web API endpoint: GET /voice/status
-        Returns runtime status including last announcements and queue state.
+        Replies with runtime status including last announcements and queue
+        state. The response is reused until an announcement or config change.
         """
-        return {
-            'enabled': self.enabled,
-            'last_announcement': self.last_announcement,
-            'last_announcement_time': self.last_announcement_time,
-            'queue_length': len(self.announcement_queue)
-        }
+        status = self._webhook_status
+        if status is None:
+            status = self._webhook_status = {
+                'enabled': self.enabled,
+                'last_announcement': self.last_announcement,
+                'last_announcement_time': self.last_announcement_time,
+                'queue_length': len(self.announcement_queue)
+            }
+        web_request.send(status)
     
     def get_status(self, eventtime):
         """
@@ -768,24 +1419,46 @@ class KlipperVoice:
             
         This method is called by Klipper's API system to provide status information
         that can be queried by external applications like Mainsail or Fluidd.
+        
+        The returned dict is reused until a reported field changes, so
+        callers must not modify it.
         """
-        return {
-            'enabled': self.enabled,
-            'volume': self.volume,
-            'language': self.language,
-            'voice_speed': self.voice_speed,
-            'last_announcement': self.last_announcement,
-            'last_announcement_time': self.last_announcement_time,
-            'queue_length': len(self.announcement_queue),
-            'auto_announce': self.auto_announce,
-            'available_messages': list(self.voice_messages.keys()),
-            'audio_player': self.selected_player,
-            'supported_formats': self.supported_formats,
-            'available_players': list(self.audio_players.keys())
-        }
+        status = self._status_dict
+        if status is None:
+            # The audio player is chosen on the worker thread; only cache
+            # once that is done so a concurrent pick can't be missed
+            cacheable = self._init_done.is_set()
+            status = {
+                **self._static_status,
+                'enabled': self.enabled,
+                'volume': self.volume,
+                'language': self.language,
+                'voice_speed': self.voice_speed,
+                'last_announcement': self.last_announcement,
+                'last_announcement_time': self.last_announcement_time,
+                'queue_length': len(self.announcement_queue),
+                'audio_player': self.selected_player
+            }
+            if cacheable:
+                self._status_dict = status
+        return status
     
     # === G-code Command Implementations ===
     
+    def _respond_and_log(self, gcmd, msg):
+        """
+        Send a G-code response and record it in the plugin log.
+        
+        Args:
+            gcmd: G-code command object
+            msg (str): Already formatted message
+            
+        respond_info() already writes the message to the Klipper log, so the
+        plugin logger only records it at debug level.
+        """
+        gcmd.respond_info(msg)
+        self.logger.debug(msg)
+    
     cmd_VOICE_ANNOUNCE_help = "Announce a voice message"
     def cmd_VOICE_ANNOUNCE(self, gcmd):
         """
@@ -803,30 +1476,31 @@ class KlipperVoice:
         - VOICE_ANNOUNCE TYPE=print_start
         - VOICE_ANNOUNCE MESSAGE="Loud message" VOLUME=1.0
         """
+        # Nothing would be played; skip parameter parsing and validation
+        if not self.enabled:
+            gcmd.respond_info("Voice disabled")
+            return
+        
         # === Parameter Extraction ===
-        message = gcmd.get('MESSAGE', None)
-        message_type = gcmd.get('TYPE', 'custom')
-        volume = gcmd.get_float('VOLUME', self.volume, minval=0.0, maxval=1.0)
+        params = gcmd.get_command_parameters()
+        message = params.get('MESSAGE')
+        message_type = params.get(_TYPE_KEY, 'custom')
+        volume = None
+        if 'VOLUME' in params:
+            volume = gcmd.get_float('VOLUME', minval=self._VOLUME_MIN,
+                                    maxval=self._VOLUME_MAX)
         
         # === Message Resolution ===
         if not message:
             # Use predefined message if no custom message provided
-            if message_type in self.voice_messages:
-                message = self.voice_messages[message_type]
-            else:
+            message = self.voice_messages.get(message_type)
+            if message is None:
                 raise gcmd.error("No MESSAGE specified and TYPE '%s' not found" % message_type)
         
-        # === Volume Override Handling ===
-        # Temporarily adjust volume if specified
-        original_volume = self.volume
-        if volume != self.volume:
-            self.volume = volume
-        
         # === Execute Announcement ===
-        success = self._announce_message(message_type, message)
-        
-        # === Restore Original Settings ===
-        self.volume = original_volume
+        # A VOLUME override travels with the queued playback; the configured
+        # volume is left untouched
+        success = self._announce_message(message_type, message, volume)
         
         # === User Feedback ===
         if success:
@@ -852,35 +1526,43 @@ class KlipperVoice:
         - VOICE_CONFIG SPEED=1.2 LANGUAGE=en
         - VOICE_CONFIG (shows current settings)
         """
-        changed = []
+        params = gcmd.get_command_parameters()
         
         # === Enable/Disable Setting ===
-        if gcmd.get('ENABLE', None) is not None:
-            self.enabled = gcmd.get_int('ENABLE', self.enabled, minval=0, maxval=1) == 1
-            changed.append("enabled=%s" % self.enabled)
+        if 'ENABLE' in params:
+            enabled = gcmd.get_int('ENABLE', minval=0, maxval=1) == 1
+            self.enabled = enabled
+            if not enabled:
+                self._next_allowed_time = float('inf')
+            elif self._next_allowed_time == float('inf'):
+                self._next_allowed_time = 0.0
         
         # === Volume Setting ===
-        if gcmd.get('VOLUME', None) is not None:
-            self.volume = gcmd.get_float('VOLUME', self.volume, minval=0.0, maxval=1.0)
-            changed.append("volume=%.1f" % self.volume)
+        if 'VOLUME' in params:
+            self.volume = gcmd.get_float('VOLUME', minval=self._VOLUME_MIN,
+                                         maxval=self._VOLUME_MAX)
+            self._update_volume_args()
         
         # === Speed Setting ===
-        if gcmd.get('SPEED', None) is not None:
-            self.voice_speed = gcmd.get_float('SPEED', self.voice_speed, minval=0.5, maxval=2.0)
-            changed.append("speed=%.1f" % self.voice_speed)
+        if 'SPEED' in params:
+            self.voice_speed = gcmd.get_float('SPEED', minval=self._SPEED_MIN,
+                                              maxval=self._SPEED_MAX)
         
         # === Language Setting ===
-        if gcmd.get('LANGUAGE', None) is not None:
-            self.language = gcmd.get('LANGUAGE', self.language)
-            changed.append("language=%s" % self.language)
+        if 'LANGUAGE' in params:
+            self.language = gcmd.get('LANGUAGE')
         
         # === User Feedback ===
+        changed = [template % getattr(self, attr)
+                   for param, template, attr in self._CONFIG_FIELDS if param in params]
         if changed:
-            gcmd.respond_info("Voice config updated: %s" % ", ".join(changed))
-            self.logger.info("Voice config updated: %s", ", ".join(changed))
+            self._status_dirty = True
+            self._status_dict = None
+            self._webhook_status = None
+            self._respond_and_log(gcmd, "Voice config updated: %s" % ", ".join(changed))
         else:
             # Show current settings if no parameters provided
-            gcmd.respond_info("Voice config - enabled: %s, volume: %.1f, speed: %.1f, language: %s" % 
+            gcmd.respond_info(self._CONFIG_INFO_TEMPLATE % 
                             (self.enabled, self.volume, self.voice_speed, self.language))
     
     cmd_VOICE_STATUS_help = "Show voice plugin status"
@@ -897,21 +1579,17 @@ class KlipperVoice:
         
         No parameters required.
         """
-        # === Status Information Collection ===
-        status_info = [
-            "Voice Plugin Status:",
-            "  Enabled: %s" % self.enabled,
-            "  Volume: %.1f" % self.volume,
-            "  Speed: %.1f" % self.voice_speed,
-            "  Language: %s" % self.language,
-            "  Audio Player: %s" % (self.selected_player or "None"),
-            "  Supported Formats: %s" % ", ".join(self.supported_formats),
-            "  Last announcement: %s" % (self.last_announcement or "None"),
-            "  Queue length: %d" % len(self.announcement_queue)
-        ]
+        # === Settings Section (cached) ===
+        if self._status_dirty:
+            self._status_cache = self._STATUS_SETTINGS_TEMPLATE % (
+                self.enabled, self.volume, self.voice_speed, self.language,
+                self.selected_player or "None", self._supported_formats_csv)
+            self._status_dirty = False
         
         # === Send Status to User ===
-        gcmd.respond_info("\n".join(status_info))
+        # Last announcement and queue length change constantly; append them
+        gcmd.respond_info(self._status_cache + self._STATUS_TAIL_TEMPLATE %
+                          (self.last_announcement or "None", len(self.announcement_queue)))
     
     cmd_VOICE_TEST_help = "Test voice functionality"
     def cmd_VOICE_TEST(self, gcmd):
@@ -931,11 +1609,18 @@ class KlipperVoice:
         - VOICE_TEST (tests 'ready' message)
         - VOICE_TEST TYPE=print_start
         """
+        # Nothing would be played; skip parameter parsing and validation
+        if not self.enabled:
+            gcmd.respond_info("Voice disabled")
+            return
+        
         # === Parameter Extraction ===
-        test_type = gcmd.get('TYPE', 'ready')
+        # Intern user input so the lookup compares against the interned
+        # dict keys by identity
+        test_type = sys.intern(gcmd.get(_TYPE_KEY, _DEFAULT_TEST_TYPE))
         
         # === Test Execution ===
-        if test_type in self.voice_messages:
+        if test_type in self._valid_test_types:
             success = self._announce_message(test_type)
             if success:
                 gcmd.respond_info("Voice test completed: %s" % test_type)
@@ -943,8 +1628,8 @@ class KlipperVoice:
                 gcmd.respond_info("Voice test blocked (disabled or too frequent)")
         else:
             # === Error Handling ===
-            available_types = ", ".join(self.voice_messages.keys())
-            raise gcmd.error("Unknown test type '%s'. Available: %s" % (test_type, available_types))
+            raise gcmd.error("Unknown test type '%s'. Available: %s"
+                             % (test_type, self._available_types_str))
     
     cmd_VOICE_SCAN_help = "Scan for audio files and rebuild cache"
     def cmd_VOICE_SCAN(self, gcmd):
@@ -958,34 +1643,43 @@ class KlipperVoice:
         
         No parameters required.
         """
+        # === Wait For Initialization ===
+        # The worker thread detects the player and scans on startup; a scan
+        # from here before that finishes would race it and could pick files
+        # for the wrong player
+        if not self._init_done.is_set():
+            gcmd.respond_info("Audio system still initializing; "
+                              "audio files are scanned once it is ready")
+            return
+        
         # === Rescan Audio Files ===
+        # Force a full walk unless one just ran; then rely on the mtime check
+        now = self.reactor.monotonic()
+        force = now - self._last_forced_scan >= self._SCAN_DEBOUNCE_TIME
+        if force:
+            self._last_forced_scan = now
         self.logger.info("Rescanning audio files...")
-        self._scan_audio_files()
+        self._scan_audio_files(force=force)
         
         # === Report Results ===
-        total_files = 0
-        for msg_type in self.audio_file_cache.values():
-            for lang_files in msg_type.values():
-                total_files += len(lang_files)
-        
-        message_types = list(self.audio_file_cache.keys())
-        
-        gcmd.respond_info("Audio file scan completed:")
-        gcmd.respond_info("  Audio Player: %s" % (self.selected_player or "None"))
-        gcmd.respond_info("  Found %d audio files" % total_files)
-        gcmd.respond_info("  Supported Formats: %s" % ", ".join(self.supported_formats))
-        gcmd.respond_info("  Available message types: %s" % ", ".join(message_types))
+        lines = [
+            "Audio file scan completed:",
+            "  Audio Player: %s" % (self.selected_player or "None"),
+            "  Found %d audio files" % self._total_audio_files,
+            "  Supported Formats: %s" % self._supported_formats_csv,
+            "  Available message types: %s" % self._message_types_str
+        ]
         
         # === Show Missing Files ===
-        missing_types = []
-        for msg_type in self.voice_messages.keys():
-            if msg_type not in self.audio_file_cache:
-                missing_types.append(msg_type)
+        missing_types = self.voice_messages.keys() - self.audio_file_cache.keys()
         
         if missing_types:
-            gcmd.respond_info("  Missing audio files for: %s" % ", ".join(missing_types))
+            lines.append("  Missing audio files for: %s" % ", ".join(sorted(missing_types)))
         else:
-            gcmd.respond_info("  All message types have audio files available")
+            lines.append("  All message types have audio files available")
+        
+        # === Send Report to User ===
+        gcmd.respond_info("\n".join(lines))
 
 
 def load_config(config):